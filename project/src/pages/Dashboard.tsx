@@ -142,6 +142,8 @@ export const Dashboard: React.FC = () => {
           {/* Tabs */}
           <div className="mb-6 flex border-b">
             <button
+              data-testid="tab-browse"
+              aria-selected={activeTab === 'browse'}
               className={`px-4 py-2 font-medium ${
                 activeTab === 'browse' 
                   ? 'border-b-2 border-blue-500 text-blue-600' 
@@ -152,6 +154,8 @@ export const Dashboard: React.FC = () => {
               Browse All Items
             </button>
             <button
+              data-testid="tab-my-reports"
+              aria-selected={activeTab === 'myItems'}
               className={`px-4 py-2 font-medium ${
                 activeTab === 'myItems' 
                   ? 'border-b-2 border-blue-500 text-blue-600' 
@@ -178,6 +182,7 @@ export const Dashboard: React.FC = () => {
               </div>
               
               <select
+                data-testid="filter-type"
                 value={selectedType}
                 onChange={(e) => setSelectedType(e.target.value as 'all' | 'lost' | 'found')}
                 className="rounded-md border-gray-300 shadow-sm focus:border-blue-500 focus:ring-blue-500"
@@ -207,7 +212,7 @@ export const Dashboard: React.FC = () => {
         </div>
 
         {/* Items Grid */}
-        <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
+        <div data-testid="results" className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
           {filteredItems.map((item) => (
             <div key={item._id} className="bg-white/80 backdrop-blur-md rounded-xl shadow-lg overflow-hidden hover:shadow-xl transition-shadow">
               {item.image && (
@@ -233,7 +233,7 @@ export const Profile: React.FC = () => {
           <div className="px-6 pt-16 pb-6">
             <div className="space-y-4">
               <h1 className="text-2xl font-bold text-gray-900">{user?.name || 'User'}</h1>
-              <p className="text-gray-600">{user?.email || 'No email provided'}</p>
+              <p data-testid="profile-email" className="text-gray-600">{user?.email || 'No email provided'}</p>
 
               {/* Member Since - Use the user's createdAt property if available */}
               <p className="text-sm text-gray-500">
@@ -163,6 +163,7 @@ export const ReportItem: React.FC = () => {
               <div className="mt-1 relative">
                 <Tag className="absolute left-3 top-1/2 transform -translate-y-1/2 h-5 w-5 text-gray-400" />
                 <input
+                  id="title"
                   {...register('title', { 
                     required: 'Title is required',
                     minLength: { value: 3, message: 'Title must be at least 3 characters' },
@@ -186,6 +187,7 @@ export const ReportItem: React.FC = () => {
                 Category
               </label>
               <select
+                id="category"
                 {...register('category', { required: 'Category is required' })}
                 className={`mt-1 block w-full rounded-md shadow-sm focus:ring-blue-500 ${
                   errors.category ? 'border-red-500 focus:border-red-500' : 'border-gray-300 focus:border-blue-500'
@@ -209,6 +211,7 @@ export const ReportItem: React.FC = () => {
               <div className="mt-1 relative">
                 <FileText className="absolute left-3 top-3 h-5 w-5 text-gray-400" />
                 <textarea
+                  id="description"
                   {...register('description', { 
                     required: 'Description is required',
                     minLength: { value: 10, message: 'Description must be at least 10 characters' },
@@ -234,6 +237,7 @@ export const ReportItem: React.FC = () => {
               <div className="mt-1 relative">
                 <MapPin className="absolute left-3 top-1/2 transform -translate-y-1/2 h-5 w-5 text-gray-400" />
                 <input
+                  id="location"
                   {...register('location', { 
                     required: 'Location is required',
                     minLength: { value: 3, message: 'Location must be at least 3 characters' },
@@ -259,6 +263,7 @@ export const ReportItem: React.FC = () => {
               <div className="mt-1 relative">
                 <Calendar className="absolute left-3 top-1/2 transform -translate-y-1/2 h-5 w-5 text-gray-400" />
                 <input
+                  id="date"
                   {...register('date', { required: 'Date is required' })}
                   type="date"
                   className={`pl-10 block w-full rounded-md shadow-sm focus:ring-blue-500 ${
@@ -278,6 +283,7 @@ export const ReportItem: React.FC = () => {
                 Contact Information
               </label>
               <input
+                id="contactInfo"
                 {...register('contactInfo', {
                   maxLength: { value: 200, message: 'Contact info cannot exceed 200 characters' }
                 })}
@@ -0,0 +1,156 @@
+"""Process-wide WebDriver shared by every TestCase class a test worker runs."""
+import os
+import shutil
+import tempfile
+from multiprocessing import util
+from functools import lru_cache
+from urllib.parse import urlsplit
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.driver_cache import DriverCacheManager
+
+# Resource patterns no test depends on (item photos, icons, fonts). Item photos are served
+# from Cloudinary with fetch_format=auto, so block that host outright as well as by extension.
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf",
+    "*res.cloudinary.com*",
+]
+
+NO_ANIMATIONS_JS = """
+(function () {
+    function inject() {
+        var style = document.createElement('style');
+        style.textContent = '*, *::before, *::after { animation: none !important; transition: none !important; }';
+        (document.head || document.documentElement).appendChild(style);
+    }
+    if (document.documentElement) {
+        inject();
+    } else {
+        document.addEventListener('readystatechange', inject, {once: true});
+    }
+})();
+"""
+
+# Form helpers for the tests, defined once per document as window.__t:
+#   submit()                     - submit the page's form without clicking its button
+#   errors(css)                  - the trimmed text of every element matching css, empty ones dropped
+#   diagnose(errorCss, dateCss)  - in one round-trip, errors(errorCss), the form's filled-in
+#                                  values by name and the date value
+TEST_HELPERS_JS = """
+window.__t = {
+    submit: function () {
+        document.querySelector('form').submit();
+    },
+    errors: function (css) {
+        return Array.from(document.querySelectorAll(css))
+            .map(function (el) { return el.innerText.trim(); })
+            .filter(Boolean);
+    },
+    diagnose: function (errorCss, dateCss) {
+        var form = document.querySelector('form');
+        var data = {};
+        if (form) {
+            Array.from(form.elements).forEach(function (el) {
+                if (el.name && el.value && (!/^(radio|checkbox)$/.test(el.type) || el.checked)) {
+                    data[el.name] = el.value;
+                }
+            });
+        }
+        var date = document.querySelector(dateCss);
+        return {
+            errors: window.__t.errors(errorCss),
+            data: data,
+            dateValue: date ? date.value : null
+        };
+    }
+};
+"""
+
+
+@lru_cache(maxsize=None)
+def chromedriver_path():
+    """Resolve the ChromeDriver binary once per process and reuse it for every class.
+
+    CHROMEDRIVER_PATH (e.g. primed by an earlier CI step) skips the lookup entirely;
+    otherwise webdriver-manager only re-checks versions once the 7-day cache expires.
+    """
+    if os.environ.get("CHROMEDRIVER_PATH"):
+        return os.environ["CHROMEDRIVER_PATH"]
+    return ChromeDriverManager(cache_manager=DriverCacheManager(valid_range=7)).install()
+
+
+@lru_cache(maxsize=None)
+def get_driver():
+    """Start headless Chrome on first use; later calls in this process get the same instance."""
+    # Setup Chrome options optimized for CI/CD and headless environment
+    chrome_options = webdriver.ChromeOptions()
+    chrome_options.add_argument("--headless=new")  # New headless mode (Chrome 109+) for CI/CD
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--window-size=1920,1080")  # Set window size
+    # Skip browser subsystems the tests never use, to cut startup and page-load time
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-default-apps")
+    chrome_options.add_argument("--disable-sync")
+    chrome_options.add_argument("--metrics-recording-only")
+    chrome_options.add_argument("--no-first-run")
+    chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+    chrome_options.add_argument("--disable-renderer-backgrounding")
+    chrome_options.add_argument("--disable-features=Translate,BackForwardCache,AcceptCHFrame,MediaRouter")
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")  # No test checks images
+    # The profile-level equivalent (2 = block), enforced by the browser rather than the renderer
+    chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    # Return from driver.get() at DOMContentLoaded; the tests wait explicitly for what they need
+    chrome_options.page_load_strategy = "eager"
+    # Explicit on-disk profile per worker process, so the HTTP and compiled-JS caches for the
+    # app bundle are kept if Chrome is ever relaunched in this worker. Keyed by PID: parallel
+    # workers must never share a profile directory.
+    profile_dir = os.path.join(tempfile.gettempdir(), f"chrome-{os.getpid()}")
+    chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+
+    driver = webdriver.Chrome(service=Service(chromedriver_path()), options=chrome_options)
+    # Quit and delete the profile when the process exits. A multiprocessing finalizer rather
+    # than atexit: it also runs when a unittest-parallel pool worker shuts down, atexit never does.
+    util.Finalize(None, _shutdown, args=(driver, profile_dir), exitpriority=10)
+
+    # Explicit WebDriverWaits only: with no implicit wait a failed lookup returns at once
+    # instead of silently stacking a hidden timeout on top of the explicit one.
+    driver.implicitly_wait(0)
+    driver.set_page_load_timeout(15)
+    driver.set_script_timeout(10)
+
+    # Don't download images or web fonts at all. Stylesheets are left alone: the Vite dev
+    # server serves imported .css as JS modules, and the visibility waits depend on styling.
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+    # Kill CSS animations/transitions on every page so clickability waits aren't held up by them
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": NO_ANIMATIONS_JS})
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": TEST_HELPERS_JS})
+    return driver
+
+
+def _shutdown(driver, profile_dir):
+    """Quit Chrome, then remove the profile directory it was using."""
+    try:
+        driver.quit()
+    finally:
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+def reset_session(driver, base_url):
+    """Drop the app's cookies and localStorage (holding the JWT) so the next class starts logged out.
+
+    sessionStorage is left alone: CDP's Storage.clearDataForOrigin has no storage type for it,
+    and the frontend doesn't use it.
+    """
+    url = urlsplit(base_url)
+    driver.delete_all_cookies()
+    # Clearing storage over CDP works from any page, including the initial data: URL,
+    # where calling localStorage.clear() from a script would raise a SecurityError.
+    driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+        "origin": f"{url.scheme}://{url.netloc}",
+        "storageTypes": "local_storage",
+    })
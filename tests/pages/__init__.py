@@ -0,0 +1,4 @@
+"""Page objects for the Lost & Found frontend."""
+from pages.login import LoginPage
+from pages.register import RegisterPage
+from pages.report import ReportPage
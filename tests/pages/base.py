@@ -0,0 +1,27 @@
+"""Shared plumbing for page objects."""
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import NoSuchElementException
+
+# Resolves a list of CSS selectors to element handles (or null) in a single round-trip
+FIND_ALL_JS = "return arguments[0].map(function (css) { return document.querySelector(css); });"
+
+
+class BasePage:
+    """A rendered page whose controls are looked up once, when the page object is created."""
+
+    # CSS selector that is visible once the page has rendered
+    ready_css = None
+
+    def __init__(self, driver, wait):
+        self.driver = driver
+        self.wait = wait
+        wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, self.ready_css)))
+
+    def _find_all(self, *selectors):
+        """Return one element per selector, fetched with a single execute_script."""
+        elements = self.driver.execute_script(FIND_ALL_JS, list(selectors))
+        missing = [css for css, element in zip(selectors, elements) if element is None]
+        if missing:
+            raise NoSuchElementException(f"Elements not found: {', '.join(missing)}")
+        return elements
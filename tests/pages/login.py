@@ -0,0 +1,22 @@
+"""Page object for /login."""
+from pages.base import BasePage
+
+EMAIL_CSS = "input[placeholder='Enter your email']"
+PW_CSS = "input[placeholder='Enter your password']"
+SUBMIT_BTN_CSS = "button[type='submit']"
+
+
+class LoginPage(BasePage):
+    """The login form: email, password and submit button."""
+
+    ready_css = EMAIL_CSS
+
+    def __init__(self, driver, wait):
+        super().__init__(driver, wait)
+        self.email, self.password, self.submit = self._find_all(EMAIL_CSS, PW_CSS, SUBMIT_BTN_CSS)
+
+    def login(self, email, password):
+        """Fill in the credentials and submit the form."""
+        self.email.send_keys(email)
+        self.password.send_keys(password)
+        self.submit.click()
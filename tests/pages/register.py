@@ -0,0 +1,25 @@
+"""Page object for /register."""
+from pages.base import BasePage
+from pages.login import EMAIL_CSS, PW_CSS, SUBMIT_BTN_CSS
+
+NAME_CSS = "input[placeholder='Enter your full name']"
+CONFIRM_PW_CSS = "input[placeholder='Confirm your password']"
+
+
+class RegisterPage(BasePage):
+    """The sign-up form: name, email, password, confirmation and submit button."""
+
+    ready_css = NAME_CSS
+
+    def __init__(self, driver, wait):
+        super().__init__(driver, wait)
+        self.name, self.email, self.password, self.confirm, self.submit = self._find_all(
+            NAME_CSS, EMAIL_CSS, PW_CSS, CONFIRM_PW_CSS, SUBMIT_BTN_CSS)
+
+    def register(self, name, email, password):
+        """Fill in the form, confirming the password, and submit it."""
+        self.name.send_keys(name)
+        self.email.send_keys(email)
+        self.password.send_keys(password)
+        self.confirm.send_keys(password)
+        self.submit.click()
@@ -0,0 +1,90 @@
+"""Page object for /report."""
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.select import Select
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, WebDriverException
+from pages.base import BasePage
+
+TITLE_CSS = "#title, [name='title']"
+DESCRIPTION_CSS = "#description, [name='description']"
+CATEGORY_CSS = "#category, [name='category']"
+LOCATION_CSS = "#location, [name='location']"
+DATE_CSS = "#date, [name='date'], input[type='date']"
+CONTACT_CSS = "#contactInfo, [name='contactInfo']"
+
+# Sets every [element, value] pair in one call. The native value setter is used so
+# React's input tracking notices the change, then input/change events are fired.
+FILL_FIELDS_JS = """
+arguments[0].forEach(function (pair) {
+    var el = pair[0], value = pair[1];
+    var setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set;
+    setter.call(el, value);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+});
+"""
+
+# Picks the first <option> whose text contains arguments[1] - one call however many options there are
+SELECT_BY_TEXT_JS = """
+var select = arguments[0], text = arguments[1];
+var option = Array.from(select.options).find(function (o) { return o.text.includes(text); });
+if (!option) {
+    throw new Error('No option containing "' + text + '"');
+}
+select.value = option.value;
+select.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+
+class ReportPage(BasePage):
+    """The lost/found report form. Its six input controls are fetched in one round-trip."""
+
+    ready_css = "form"
+
+    def __init__(self, driver, wait):
+        super().__init__(driver, wait)
+        self._locate()
+
+    def _locate(self):
+        """(Re-)fetch the six form controls in one round-trip."""
+        (self.title, self.description, self.category, self.location,
+         self.date, self.contact_info) = self._find_all(
+            TITLE_CSS, DESCRIPTION_CSS, CATEGORY_CSS, LOCATION_CSS, DATE_CSS, CONTACT_CSS)
+
+    def choose_type(self, item_type):
+        """Select the 'lost' or 'found' radio button."""
+        radio_css = f"input[type='radio'][value='{item_type}']"
+        # The radio itself is visually hidden (sr-only), so the label wrapping it is the
+        # clickable target. One compound lookup; it falls back to the bare input.
+        try:
+            self.driver.find_element(By.CSS_SELECTOR, f"label:has(> {radio_css}), {radio_css}").click()
+            print(f"Selected '{item_type}' via click")
+        except WebDriverException:
+            try:
+                self.driver.execute_script("document.querySelector(arguments[0]).click();", radio_css)
+                print(f"Selected '{item_type}' via JavaScript click")
+            except WebDriverException:
+                print(f"WARNING: Could not select '{item_type}' radio button - continuing anyway")
+
+    def select_category(self, text):
+        """Pick a category by value, falling back to a single in-page match on its visible text."""
+        try:
+            Select(self.category).select_by_value(text)
+        except NoSuchElementException:
+            self.driver.execute_script(SELECT_BY_TEXT_JS, self.category, text)
+
+    def fill(self, **values):
+        """Set any of title/description/location/date/contact_info with a single execute_script.
+
+        If React has re-rendered the form since the controls were looked up, they are
+        re-fetched (one more round-trip) and the fill is applied once more.
+        """
+        try:
+            self._fill(values)
+        except StaleElementReferenceException:
+            self._locate()
+            self._fill(values)
+
+    def _fill(self, values):
+        self.driver.execute_script(FILL_FIELDS_JS, [
+            [getattr(self, field), value] for field, value in values.items()
+        ])